@@ -11,18 +11,31 @@ from ..utils.errors import ValidationError, ConfigurationError
 
 bp = Blueprint("api", __name__)
 
-# Initialize processing pipeline (will be set by app factory)
-_processing_pipeline: ProcessingPipeline = None
-
-
-def init_handlers(config):
+def init_handlers(config) -> ProcessingPipeline:
     """Initialize handlers with configuration.
     
     Args:
         config: Application configuration
+        
+    Returns:
+        The processing pipeline built for this configuration
+    """
+    return ProcessingPipeline(config)
+
+
+def get_processing_pipeline() -> ProcessingPipeline:
+    """Return the pipeline bound to the current app.
+    
+    Each configured app keeps its own pipeline, so several apps can coexist
+    in one process.
+    
+    Raises:
+        ConfigurationError: If the current app was created without configuration
     """
-    global _processing_pipeline
-    _processing_pipeline = ProcessingPipeline(config)
+    pipeline = current_app.extensions.get("flowbridge_pipeline")
+    if pipeline is None:
+        raise ConfigurationError("No processing pipeline configured for this application")
+    return pipeline
 
 
 @bp.route("/health", methods=["GET"])
@@ -36,7 +49,7 @@ def health_check() -> Dict[str, Any]:
     response = {
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "request_id": str(request.ctx.request_id)
+        "request_id": request.ctx.request_id_str
     }
     return jsonify(response)
 
@@ -52,7 +65,7 @@ def get_config() -> Dict[str, Any]:
     config = current_app.config["FLOWBRIDGE_CONFIG"]
     response = {
         "config": config.model_dump(mode='json') if config else {},
-        "request_id": str(request.ctx.request_id)
+        "request_id": request.ctx.request_id_str
     }
     return jsonify(response)
 
@@ -75,7 +88,7 @@ def webhook_handler() -> Dict[str, Any]:
         payload = request.get_json()
         
         # Process through pipeline using existing RequestContext from middleware
-        result = _processing_pipeline.process_webhook_request(payload)
+        result = get_processing_pipeline().process_webhook_request(payload)
         
         # Convert result to HTTP response
         response_data = result.to_response()
@@ -84,7 +97,7 @@ def webhook_handler() -> Dict[str, Any]:
             # Request was dropped by filtering
             logger.info(
                 "Webhook request processed - dropped",
-                request_id=str(request.ctx.request_id),
+                request_id=request.ctx.request_id_str,
                 result="dropped"
             )
             # Convert Pydantic model to dict for JSON serialization
@@ -100,21 +113,21 @@ def webhook_handler() -> Dict[str, Any]:
                 if response_data.result == "routing_failed":
                     logger.info(
                         "Webhook request processed - routing failed",
-                        request_id=str(request.ctx.request_id),
+                        request_id=request.ctx.request_id_str,
                         result="routing_failed"
                     )
                     return jsonify(response_dict), 404  # No matching routing rule
                 elif response_data.result == "forwarding_failed":
                     logger.info(
                         "Webhook request processed - forwarding failed",
-                        request_id=str(request.ctx.request_id),
+                        request_id=request.ctx.request_id_str,
                         result="forwarding_failed"
                     )
                     return jsonify(response_dict), 502  # Gateway error
                 elif response_data.result == "success":
                     logger.info(
                         "Webhook request processed - success",
-                        request_id=str(request.ctx.request_id),
+                        request_id=request.ctx.request_id_str,
                         result="success"
                     )
                     return jsonify(response_dict), 200  # Success
@@ -126,7 +139,7 @@ def webhook_handler() -> Dict[str, Any]:
             # Dict response (fallback case)
             logger.info(
                 "Webhook request processed - passed filtering",
-                request_id=str(request.ctx.request_id),
+                request_id=request.ctx.request_id_str,
                 result="passed"
             )
             return jsonify(response_data), 200
@@ -135,11 +148,11 @@ def webhook_handler() -> Dict[str, Any]:
         error_response = {
             "error": "InvalidRequestError", 
             "message": str(e),
-            "request_id": str(request.ctx.request_id)
+            "request_id": request.ctx.request_id_str
         }
         logger.warning(
             "Webhook request validation failed",
-            request_id=str(request.ctx.request_id),
+            request_id=request.ctx.request_id_str,
             error=str(e)
         )
         return jsonify(error_response), 400
@@ -148,11 +161,11 @@ def webhook_handler() -> Dict[str, Any]:
         error_response = {
             "error": "InternalServerError",
             "message": "An unexpected error occurred during processing",
-            "request_id": str(request.ctx.request_id)
+            "request_id": request.ctx.request_id_str
         }
         logger.error(
             "Webhook request processing failed",
-            request_id=str(request.ctx.request_id),
+            request_id=request.ctx.request_id_str,
             error=str(e),
             error_type=type(e).__name__
         )
@@ -0,0 +1,75 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Separators json.dumps uses for compact and for indented output
+_COMPACT_SEPARATORS = (",", ":")
+_INDENT_SEPARATORS = (",", ": ")
+
+# Dates and dataclasses go through Flask's default() so they serialize as before
+_BASE_OPTION = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Serializes JSON with orjson; parsing stays with Flask's default provider.
+
+    Output is UTF-8 rather than ASCII-escaped, and floats use orjson's
+    formatting (``1e16`` rather than ``1e+16``, NaN and Infinity as null).
+    Calls orjson cannot handle (ASCII escaping, other separators or indents,
+    extra json.dumps options, integers beyond 64 bits) are handed to the
+    default provider. Request bodies are parsed by json.loads, which keeps
+    big integers exact and accepts NaN and Infinity.
+    """
+
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        kwargs.setdefault("default", self.default)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+
+        option = _orjson_option(kwargs)
+        if option is None:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=kwargs["default"], option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+
+def _orjson_option(kwargs: Dict[str, Any]) -> Optional[int]:
+    """Translate json.dumps arguments to orjson options.
+
+    Args:
+        kwargs: Keyword arguments destined for json.dumps
+
+    Returns:
+        orjson option flags, or None if orjson cannot match json.dumps output
+    """
+    if kwargs["ensure_ascii"] or not kwargs.keys() <= {
+        "default", "ensure_ascii", "sort_keys", "indent", "separators"
+    }:
+        return None
+
+    option = _BASE_OPTION
+    indent = kwargs.get("indent")
+    if indent is not None:
+        if indent != 2 or kwargs.get("separators", _INDENT_SEPARATORS) != _INDENT_SEPARATORS:
+            return None
+        option |= orjson.OPT_INDENT_2
+    elif kwargs.get("separators") != _COMPACT_SEPARATORS:
+        return None
+
+    if kwargs["sort_keys"]:
+        option |= orjson.OPT_SORT_KEYS
+    return option
@@ -15,7 +15,7 @@ def validate_json_request(f: Callable) -> Callable:
                 error_response = {
                     "error": "InvalidRequestError",
                     "message": "Content-Type must be application/json",
-                    "request_id": str(getattr(request, 'ctx', RequestContext()).request_id)
+                    "request_id": getattr(request, 'ctx', RequestContext()).request_id_str
                 }
                 return jsonify(error_response), 400
             
@@ -26,7 +26,7 @@ def validate_json_request(f: Callable) -> Callable:
                 error_response = {
                     "error": "InvalidRequestError",
                     "message": f"Invalid JSON format: {str(e)}",
-                    "request_id": str(getattr(request, 'ctx', RequestContext()).request_id)
+                    "request_id": getattr(request, 'ctx', RequestContext()).request_id_str
                 }
                 return jsonify(error_response), 400
 
@@ -8,6 +8,7 @@ from werkzeug.exceptions import MethodNotAllowed
 from flowbridge.core.context import RequestContext
 from flowbridge.utils.errors import FlowBridgeError
 from flowbridge.api.handlers import bp as api_bp, init_handlers
+from flowbridge.api.json_provider import OrjsonProvider
 
 def create_app(config: Optional[BaseModel] = None) -> Flask:
     """
@@ -20,6 +21,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         Configured Flask application
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Store config for access in routes
     app.config["FLOWBRIDGE_CONFIG"] = config
@@ -31,7 +33,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         
         # Initialize handlers with configuration
         logger.info("Initializing API handlers with configuration")
-        init_handlers(config)
+        app.extensions["flowbridge_pipeline"] = init_handlers(config)
 
     @app.before_request
     def before_request() -> None:
@@ -47,7 +49,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         response = {
             "error": "NotFound",
             "message": "The requested URL was not found on the server",
-            "request_id": str(getattr(request, "ctx", RequestContext()).request_id)
+            "request_id": getattr(request, "ctx", RequestContext()).request_id_str
         }
         return jsonify(response), 404
 
@@ -57,7 +59,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         response = {
             "error": "MethodNotAllowed",
             "message": f"The method {request.method} is not allowed for the requested URL",
-            "request_id": str(getattr(request, "ctx", RequestContext()).request_id)
+            "request_id": getattr(request, "ctx", RequestContext()).request_id_str
         }
         return jsonify(response), 405
 
@@ -67,7 +69,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         response = {
             "error": error.__class__.__name__,
             "message": str(error),
-            "request_id": str(getattr(request, "ctx", RequestContext()).request_id)
+            "request_id": getattr(request, "ctx", RequestContext()).request_id_str
         }
         return jsonify(response), error.status_code
 
@@ -78,7 +80,7 @@ def create_app(config: Optional[BaseModel] = None) -> Flask:
         response = {
             "error": "InternalServerError",
             "message": "An unexpected error occurred",
-            "request_id": str(getattr(request, "ctx", RequestContext()).request_id)
+            "request_id": getattr(request, "ctx", RequestContext()).request_id_str
         }
         return jsonify(response), 500
 
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Union
 
@@ -9,6 +10,11 @@ from pydantic import ValidationError as PydanticValidationError
 from ..utils.errors import ConfigurationError, ValidationError
 from .models import ConfigModel
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 def validate_config_path(config_path: Union[str, Path]) -> Path:
     """
@@ -41,7 +47,7 @@ def validate_config_path(config_path: Union[str, Path]) -> Path:
 
 def load_yaml_safely(config_path: Path) -> Dict[str, Any]:
     """
-    Load YAML configuration file using safe_load.
+    Load YAML configuration file with the safe loader (libyaml-backed if available).
     
     Args:
         config_path: Path to configuration file
@@ -54,7 +60,11 @@ def load_yaml_safely(config_path: Path) -> Dict[str, Any]:
     """
     try:
         with config_path.open('r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            loader = SafeLoader(f)
+            try:
+                return loader.get_single_data()
+            finally:
+                loader.dispose()
     except yaml.YAMLError as e:
         raise ConfigurationError(
             f"Failed to parse YAML configuration: {e}",
@@ -69,12 +79,18 @@ def load_yaml_safely(config_path: Path) -> Dict[str, Any]:
         )
 
 
-def load_config(config_path: Union[str, Path]) -> ConfigModel:
+@lru_cache(maxsize=32)
+def _load_config_cached(path: Path, mtime_ns: int, size: int) -> ConfigModel:
     """
-    Load and validate configuration from YAML file.
+    Load and validate configuration, memoized on file identity.
+    
+    The modification time and size are part of the cache key so an edited
+    file is re-read; they are not used otherwise.
     
     Args:
-        config_path: Path to configuration file
+        path: Resolved path to configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
         
     Returns:
         ConfigModel: Validated configuration object
@@ -83,11 +99,6 @@ def load_config(config_path: Union[str, Path]) -> ConfigModel:
         ConfigurationError: If configuration loading fails
         ValidationError: If configuration validation fails
     """
-    logger.info(f"Loading configuration from {config_path}")
-    
-    # Validate path
-    path = validate_config_path(config_path)
-    
     # Load YAML
     config_dict = load_yaml_safely(path)
     
@@ -105,3 +116,38 @@ def load_config(config_path: Union[str, Path]) -> ConfigModel:
             },
             original_error=e
         )
+
+
+def load_config(config_path: Union[str, Path]) -> ConfigModel:
+    """
+    Load and validate configuration from YAML file.
+    
+    Parsed configurations are cached while the file is unchanged. Frozen
+    models still hold mutable lists and dicts, so each caller receives a
+    deep copy of the cached instance.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        ConfigModel: Validated configuration object
+        
+    Raises:
+        ConfigurationError: If configuration loading fails
+        ValidationError: If configuration validation fails
+    """
+    logger.info(f"Loading configuration from {config_path}")
+    
+    # Validate path
+    path = validate_config_path(config_path)
+    
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise ConfigurationError(
+            f"Failed to read configuration file: {config_path}",
+            context={"path": str(config_path)},
+            original_error=e
+        )
+    
+    return _load_config_cached(path, stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
@@ -1,24 +1,28 @@
 from typing import Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, HttpUrl, model_validator, field_validator, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator, field_validator, ValidationError
 from pydantic.fields import Field
 import re
 from enum import Enum
 
 class GeneralConfig(BaseModel):
     """General application configuration settings."""
+    model_config = ConfigDict(frozen=True)
+
     route_timeout: int = Field(gt=0, description="Route timeout in seconds")
     log_rotation: str = Field(pattern=r"^\d+[kmg]?b$", description="Log rotation size")
     
-    @model_validator(mode='after')
-    def validate_log_rotation(self) -> 'GeneralConfig':
+    @field_validator('log_rotation')
+    @classmethod
+    def validate_log_rotation(cls, v: str) -> str:
         """Validate log rotation format (e.g., '200mb', '1gb')."""
-        if not re.match(r'^\d+[kmg]?b$', self.log_rotation.lower()):
+        if not re.match(r'^\d+[kmg]?b$', v.lower()):
             raise ValueError("Log rotation must be specified in bytes (e.g., '200mb', '1gb')")
-        self.log_rotation = self.log_rotation.lower()
-        return self
+        return v.lower()
 
 class ServerConfig(BaseModel):
     """Server-specific configuration settings."""
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(description="Server host address")
     port: int = Field(gt=0, lt=65536, description="Server port")
     workers: int = Field(default=1, gt=0, description="Number of worker processes")
@@ -50,6 +54,8 @@ class LogicOperator(str, Enum):
 
 class FilterCondition(BaseModel):
     """Individual filtering rule with field, operator, and value."""
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(description="Field path in dot notation (e.g., 'object.type')")
     operator: FilterOperator = Field(description="Comparison operator")
     value: Union[str, int, float, List[Union[str, int, float]]] = Field(
@@ -79,11 +85,15 @@ class FilterCondition(BaseModel):
 
 class FilterConditions(BaseModel):
     """Filtering conditions with logic operator and rules."""
+    model_config = ConfigDict(frozen=True)
+
     logic: LogicOperator = Field(description="Logic operator for combining rules")
     rules: List[FilterCondition] = Field(description="List of filter conditions", min_length=1)
 
 class FilteringConfig(BaseModel):
     """Complete filtering configuration with logic and conditions."""
+    model_config = ConfigDict(frozen=True)
+
     default_action: Literal["drop", "pass"] = Field(
         default="drop",
         description="Default action when no rules match"
@@ -92,6 +102,8 @@ class FilteringConfig(BaseModel):
 
 class RouteMapping(BaseModel):
     """Route mapping configuration for field values to destination URLs."""
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(description="Field path to extract routing value")
     mappings: Dict[str, HttpUrl] = Field(description="Mapping of field values to destination URLs")
 
@@ -115,6 +127,8 @@ class RouteMapping(BaseModel):
 
 class ConfigModel(BaseModel):
     """Root configuration model combining all sections."""
+    model_config = ConfigDict(frozen=True)
+
     general: GeneralConfig = Field(description="General application settings")
     server: ServerConfig = Field(description="Server configuration")
     filtering: FilteringConfig = Field(description="Filtering rules and logic")
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, List
 from uuid import UUID, uuid4
@@ -12,7 +13,7 @@ from .forwarder import ForwardingResult
 # Stage-specific Context Dataclasses
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-@dataclass
+@dataclass(slots=True)
 class FilteringContext:
     """Tracks filtering results for a request."""
     passed: bool = False
@@ -32,7 +33,7 @@ class FilteringContext:
             error_message=result.error_message
         )
 
-@dataclass
+@dataclass(slots=True)
 class RoutingContext:
     """Tracks routing results for a request."""
     destination_url: Optional[str] = None
@@ -66,7 +67,7 @@ class RoutingContext:
             evaluated_rules=result.rule_index + 1 if result.rule_index is not None else total_rules
         )
 
-@dataclass
+@dataclass(slots=True)
 class ForwardingContext:
     """Tracks forwarding results for a request."""
     destination_url: Optional[str] = None
@@ -125,6 +126,11 @@ class RequestContext:
     routing: RoutingContext = field(default_factory=RoutingContext)
     forwarding: ForwardingContext = field(default_factory=ForwardingContext)
 
+    @cached_property
+    def request_id_str(self) -> str:
+        """String form of request_id, computed once per request."""
+        return str(self.request_id)
+
     def mark_stage(self, stage_name: str) -> None:
         """Mark a processing stage as completed."""
         self.processing_stages[stage_name] = datetime.now(timezone.utc)
@@ -136,7 +142,7 @@ class RequestContext:
     def to_dict(self) -> Dict[str, Any]:
         """Convert context to dictionary for serialization."""
         return {
-            "request_id": str(self.request_id),
+            "request_id": self.request_id_str,
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata,
             "processing_stages": {
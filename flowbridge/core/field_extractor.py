@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import Any, List, Optional, Union
+from functools import lru_cache
+from sys import intern
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
 from loguru import logger
 
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FieldExtractionResult:
     """Result of field extraction from a JSON payload."""
     success: bool
@@ -12,18 +16,51 @@ class FieldExtractionResult:
     error_message: Optional[str] = None
 
 
+@lru_cache(maxsize=1024)
+def _split_field_path(field_path: str) -> Tuple[str, ...]:
+    """Split and validate a dot-notated field path, memoized per path string.
+    
+    Components are interned so lookups against interned dict keys can
+    match on identity before comparing characters.
+    """
+    components = tuple(map(intern, field_path.split('.')))
+    if not all(components):
+        raise ValueError("Field path contains empty components")
+    return components
+
+
+@lru_cache(maxsize=256)
+def _none_result(field_path: str) -> FieldExtractionResult:
+    """Shared successful result for a path that resolved to None."""
+    return FieldExtractionResult(success=True, value=None, field_path=field_path)
+
+
+@lru_cache(maxsize=256)
+def _failure_result(field_path: str, error_message: str) -> FieldExtractionResult:
+    """Shared failed result for a path and error message."""
+    return FieldExtractionResult(
+        success=False,
+        value=None,
+        field_path=field_path,
+        error_message=error_message
+    )
+
+
 class FieldExtractor:
     """Extracts values from nested JSON structures using dot notation."""
 
     @staticmethod
-    def parse_field_path(field_path: str) -> List[str]:
+    def parse_field_path(field_path: str) -> Tuple[str, ...]:
         """Parse a dot-notated field path into components.
         
+        Parsed paths are cached, so repeated lookups of the same path
+        skip the split and validation.
+        
         Args:
             field_path: Dot-notated path (e.g., "object.title")
             
         Returns:
-            List of path components
+            Tuple of path components
             
         Raises:
             ValueError: If field path is invalid
@@ -31,22 +68,18 @@ class FieldExtractor:
         if not field_path or not isinstance(field_path, str):
             raise ValueError("Field path must be a non-empty string")
             
-        components = field_path.split('.')
-        if not all(components):
-            raise ValueError("Field path contains empty components")
-            
-        return components
+        return _split_field_path(field_path)
 
     @staticmethod
     def traverse_nested_structure(
         data: Union[dict, list], 
-        path_components: List[str]
+        path_components: Sequence[str]
     ) -> Any:
         """Traverse a nested structure following the path components.
         
         Args:
             data: The nested data structure to traverse
-            path_components: List of path components to follow
+            path_components: Sequence of path components to follow (as returned by parse_field_path)
             
         Returns:
             The value at the specified path
@@ -63,9 +96,9 @@ class FieldExtractor:
                 return None
                 
             if isinstance(current, dict):
-                if component not in current:
+                current = current.get(component, _MISSING)
+                if current is _MISSING:
                     raise KeyError(f"Key '{component}' not found")
-                current = current[component]
             else:
                 raise TypeError(f"Cannot traverse through type {type(current)}")
                 
@@ -89,31 +122,77 @@ class FieldExtractor:
             path_components = self.parse_field_path(field_path)
             
             if not isinstance(payload, dict):
-                return FieldExtractionResult(
-                    success=False,
-                    value=None,
-                    field_path=field_path,
-                    error_message="Payload must be a dictionary"
-                )
+                return _failure_result(field_path, "Payload must be a dictionary")
                 
-            value = self.traverse_nested_structure(payload, path_components)
-            
-            return FieldExtractionResult(
-                success=True,
-                value=value,
-                field_path=field_path
-            )
+            return self._resolve(payload, field_path, path_components)
             
         except (ValueError, KeyError, TypeError) as e:
-            logger.warning(
-                "Field extraction failed",
-                field_path=field_path,
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            return FieldExtractionResult(
-                success=False,
-                value=None,
-                field_path=field_path,
-                error_message=str(e)
-            )
\ No newline at end of file
+            return self._extraction_failed(field_path, e)
+
+    def extract_fields(
+        self,
+        payload: dict,
+        field_paths: Iterable[str]
+    ) -> Dict[str, FieldExtractionResult]:
+        """Extract several field values from one payload.
+        
+        The payload type is checked once for the whole batch. Each result
+        matches what extract_field returns for that path.
+        
+        Args:
+            payload: The JSON payload to extract from
+            field_paths: Dot-notated paths to the desired fields
+            
+        Returns:
+            Mapping of field path to its FieldExtractionResult
+        """
+        if not isinstance(payload, dict):
+            return {
+                field_path: self.extract_field(payload, field_path)
+                for field_path in field_paths
+            }
+        
+        results: Dict[str, FieldExtractionResult] = {}
+        for field_path in field_paths:
+            try:
+                results[field_path] = self._resolve(
+                    payload, field_path, self.parse_field_path(field_path)
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                results[field_path] = self._extraction_failed(field_path, e)
+        return results
+
+    def _resolve(
+        self,
+        payload: dict,
+        field_path: str,
+        path_components: Sequence[str]
+    ) -> FieldExtractionResult:
+        """Look up parsed path components in a dict payload."""
+        value = self.traverse_nested_structure(payload, path_components)
+        if value is None:
+            return _none_result(field_path)
+        return FieldExtractionResult(
+            success=True,
+            value=value,
+            field_path=field_path
+        )
+
+    @staticmethod
+    def _extraction_failed(field_path: str, error: Exception) -> FieldExtractionResult:
+        """Log a failed extraction and build its result."""
+        logger.warning(
+            "Field extraction failed",
+            field_path=field_path,
+            error=str(error),
+            error_type=type(error).__name__
+        )
+        if isinstance(field_path, str):
+            return _failure_result(field_path, str(error))
+        # Other path types may be unhashable or compare equal (1 == True)
+        return FieldExtractionResult(
+            success=False,
+            value=None,
+            field_path=field_path,
+            error_message=str(error)
+        )
@@ -241,7 +241,7 @@ class ProcessingResult:
         Returns:
             Appropriate response model based on processing outcome
         """
-        request_id = str(self.request_context.request_id)
+        request_id = self.request_context.request_id_str
         
         # Request was dropped by filtering
         if self.is_dropped and self.filtering_summary:
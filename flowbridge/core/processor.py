@@ -7,7 +7,6 @@ from .models import (
     ProcessingStage,
     FilteringSummary,
     RoutingSummary,
-    ForwardingSummary,
     DestinationResponse,
 )
 from .context import FilteringContext, RoutingContext, ForwardingContext
@@ -80,204 +79,192 @@ class ProcessingPipeline:
         # Add payload to request metadata
         request_context.add_metadata("payload", payload)
         
-        try:
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            # Stage 1: Validation (minimal - just ensure it's a dict)
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            logger.info(
-                "Starting request processing",
-                request_id=str(request_context.request_id),
-                stage=ProcessingStage.VALIDATION.name
-            )
-            request_context.mark_stage("validation")
-            validated_payload = self.validate_request_payload(payload)
+        # Bind the request ID once; every log call below (including in the
+        # filter/routing/forwarding engines) inherits it via loguru context
+        with logger.contextualize(request_id=request_context.request_id_str):
+            try:
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                # Stage 1: Validation (minimal - just ensure it's a dict)
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                logger.info(
+                    "Starting request processing",
+                    stage=ProcessingStage.VALIDATION.name
+                )
+                request_context.mark_stage("validation")
+                validated_payload = self.validate_request_payload(payload)
             
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            # Stage 2: Filtering
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            logger.info(
-                "Request validation successful, proceeding to filtering",
-                request_id=str(request_context.request_id),
-                stage=ProcessingStage.FILTERING.name
-            )
-            request_context.mark_stage("filtering")
-            filter_result = self.filter_engine.evaluate_payload(validated_payload)
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                # Stage 2: Filtering
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                logger.info(
+                    "Request validation successful, proceeding to filtering",
+                    stage=ProcessingStage.FILTERING.name
+                )
+                request_context.mark_stage("filtering")
+                filter_result = self.filter_engine.evaluate_payload(validated_payload)
             
-            # Update filtering context using existing method
-            request_context.filtering = FilteringContext.from_filter_result(filter_result)
+                # Update filtering context using existing method
+                request_context.filtering = FilteringContext.from_filter_result(filter_result)
             
-            # Create filtering summary for HTTP response
-            filtering_summary = FilteringSummary.from_filtering_context(
-                request_context.filtering
-            )
+                # Create filtering summary for HTTP response
+                filtering_summary = FilteringSummary.from_filtering_context(
+                    request_context.filtering
+                )
+            
+                # Determine if request should be dropped
+                is_dropped = not filter_result.passed
             
-            # Determine if request should be dropped
-            is_dropped = not filter_result.passed
+                if is_dropped:
+                    logger.info(
+                        "Request dropped by filtering rules",
+                        rules_evaluated=filter_result.rules_evaluated,
+                        default_action_applied=filter_result.default_action_applied
+                    )
+                    return ProcessingResult(
+                        request_context=request_context,
+                        is_dropped=True,
+                        filtering_summary=filtering_summary,
+                        stage=ProcessingStage.FILTERING
+                    )
             
-            if is_dropped:
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                # Stage 3: Routing
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
                 logger.info(
-                    "Request dropped by filtering rules",
-                    request_id=str(request_context.request_id),
+                    "Request passed filtering rules, proceeding to routing",
                     rules_evaluated=filter_result.rules_evaluated,
-                    default_action_applied=filter_result.default_action_applied
-                )
-                return ProcessingResult(
-                    request_context=request_context,
-                    is_dropped=True,
-                    filtering_summary=filtering_summary,
-                    stage=ProcessingStage.FILTERING
+                    matched_rules=filtering_summary.matched_rules,
+                    stage=ProcessingStage.ROUTING.name
                 )
+                request_context.mark_stage("routing")
             
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            # Stage 3: Routing
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            logger.info(
-                "Request passed filtering rules, proceeding to routing",
-                request_id=str(request_context.request_id),
-                rules_evaluated=filter_result.rules_evaluated,
-                matched_rules=filtering_summary.matched_rules,
-                stage=ProcessingStage.ROUTING.name
-            )
-            request_context.mark_stage("routing")
+                # Perform routing using RoutingEngine
+                routing_result = self.routing_engine.find_destination(validated_payload)
             
-            # Perform routing using RoutingEngine
-            routing_result = self.routing_engine.find_destination(validated_payload)
+                # Update routing context
+                request_context.routing = RoutingContext.from_routing_result(
+                    routing_result, 
+                    total_rules=len(self.config.routes)
+                )
             
-            # Update routing context
-            request_context.routing = RoutingContext.from_routing_result(
-                routing_result, 
-                total_rules=len(self.config.routes)
-            )
+                # Create routing summary for HTTP response
+                routing_summary = RoutingSummary.from_routing_context(
+                    request_context.routing
+                )
             
-            # Create routing summary for HTTP response
-            routing_summary = RoutingSummary.from_routing_context(
-                request_context.routing
-            )
+                # Check if routing was successful
+                if not routing_result.success:
+                    logger.info(
+                        "Request routing failed",
+                        field_path=routing_result.field_path,
+                        error_message=routing_result.error_message,
+                        total_rules=len(self.config.routes)
+                    )
+                    return ProcessingResult(
+                        request_context=request_context,
+                        is_dropped=False,
+                        filtering_summary=filtering_summary,
+                        routing_summary=routing_summary,
+                        error_message=routing_result.error_message,
+                        error_type="ROUTING_ERROR",
+                        stage=ProcessingStage.ROUTING
+                    )
             
-            # Check if routing was successful
-            if not routing_result.success:
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+                # Stage 4: Forwarding
+                # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
                 logger.info(
-                    "Request routing failed",
-                    request_id=str(request_context.request_id),
-                    field_path=routing_result.field_path,
-                    error_message=routing_result.error_message,
-                    total_rules=len(self.config.routes)
-                )
-                return ProcessingResult(
-                    request_context=request_context,
-                    is_dropped=False,
-                    filtering_summary=filtering_summary,
-                    routing_summary=routing_summary,
-                    error_message=routing_result.error_message,
-                    error_type="ROUTING_ERROR",
-                    stage=ProcessingStage.ROUTING
+                    "Request routing successful, proceeding to forwarding",
+                    destination_url=routing_result.destination_url,
+                    matched_value=routing_result.matched_value,
+                    rule_index=routing_result.rule_index,
+                    stage=ProcessingStage.FORWARDING.name
                 )
+                request_context.mark_stage("forwarding")
             
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            # Stage 4: Forwarding
-            # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-            logger.info(
-                "Request routing successful, proceeding to forwarding",
-                request_id=str(request_context.request_id),
-                destination_url=routing_result.destination_url,
-                matched_value=routing_result.matched_value,
-                rule_index=routing_result.rule_index,
-                stage=ProcessingStage.FORWARDING.name
-            )
-            request_context.mark_stage("forwarding")
-            
-            try:
-                # Prepare headers from original request
-                original_headers = {}
                 try:
-                    if hasattr(request, 'headers'):
-                        original_headers = dict(request.headers)
-                except RuntimeError:
-                    # No request context (e.g., in tests)
+                    # Prepare headers from original request
                     original_headers = {}
+                    try:
+                        if hasattr(request, 'headers'):
+                            original_headers = dict(request.headers)
+                    except RuntimeError:
+                        # No request context (e.g., in tests)
+                        original_headers = {}
                 
-                # Forward request to destination
-                forwarding_result = self.request_forwarder.forward_request(
-                    url=routing_result.destination_url,
-                    payload=validated_payload,
-                    original_headers=original_headers
-                )
+                    # Forward request to destination
+                    forwarding_result = self.request_forwarder.forward_request(
+                        url=routing_result.destination_url,
+                        payload=validated_payload,
+                        original_headers=original_headers
+                    )
                 
-                # Update forwarding context
-                request_context.forwarding = ForwardingContext.from_forwarding_result(forwarding_result)
+                    # Update forwarding context
+                    request_context.forwarding = ForwardingContext.from_forwarding_result(forwarding_result)
                 
-                # Create forwarding summary for HTTP response
-                forwarding_summary = ForwardingSummary.from_forwarding_context(
-                    request_context.forwarding
-                )
+                    # Check if forwarding was successful
+                    if not forwarding_result.success:
+                        logger.warning(
+                            "Request forwarding failed",
+                            destination_url=forwarding_result.destination_url,
+                            error_type=forwarding_result.error_type,
+                            error_message=forwarding_result.error_message,
+                            response_time_ms=forwarding_result.response_time_ms
+                        )
+                        return ProcessingResult(
+                            request_context=request_context,
+                            is_dropped=False,
+                            filtering_summary=filtering_summary,
+                            routing_summary=routing_summary,
+                            error_message=forwarding_result.error_message,
+                            error_type=forwarding_result.error_type,
+                            stage=ProcessingStage.FORWARDING
+                        )
                 
-                # Check if forwarding was successful
-                if not forwarding_result.success:
-                    logger.warning(
-                        "Request forwarding failed",
-                        request_id=str(request_context.request_id),
+                    # Forwarding successful - create destination response
+                    destination_response = DestinationResponse.from_forwarding_result(forwarding_result)
+                
+                    logger.info(
+                        "Request forwarding successful",
                         destination_url=forwarding_result.destination_url,
-                        error_type=forwarding_result.error_type,
-                        error_message=forwarding_result.error_message,
-                        response_time_ms=forwarding_result.response_time_ms
+                        status_code=forwarding_result.status_code,
+                        response_time_ms=forwarding_result.response_time_ms,
+                        content_length=len(forwarding_result.content) if forwarding_result.content else 0
                     )
+                
                     return ProcessingResult(
                         request_context=request_context,
                         is_dropped=False,
                         filtering_summary=filtering_summary,
                         routing_summary=routing_summary,
-                        error_message=forwarding_result.error_message,
-                        error_type=forwarding_result.error_type,
-                        stage=ProcessingStage.FORWARDING
+                        destination_response=destination_response,
+                        stage=ProcessingStage.COMPLETE
                     )
                 
-                # Forwarding successful - create destination response
-                destination_response = DestinationResponse.from_forwarding_result(forwarding_result)
-                
-                logger.info(
-                    "Request forwarding successful",
-                    request_id=str(request_context.request_id),
-                    destination_url=forwarding_result.destination_url,
-                    status_code=forwarding_result.status_code,
-                    response_time_ms=forwarding_result.response_time_ms,
-                    content_length=len(forwarding_result.content) if forwarding_result.content else 0
-                )
-                
-                return ProcessingResult(
-                    request_context=request_context,
-                    is_dropped=False,
-                    filtering_summary=filtering_summary,
-                    routing_summary=routing_summary,
-                    destination_response=destination_response,
-                    stage=ProcessingStage.COMPLETE
-                )
-                
+                except Exception as e:
+                    logger.error(
+                        "Unexpected error during request forwarding",
+                        destination_url=routing_result.destination_url,
+                        error=str(e)
+                    )
+                    return ProcessingResult(
+                        request_context=request_context,
+                        is_dropped=False,
+                        filtering_summary=filtering_summary,
+                        routing_summary=routing_summary,
+                        error_message=f"Forwarding error: {str(e)}",
+                        error_type="FORWARDING_ERROR",
+                        stage=ProcessingStage.FORWARDING
+                    )
+            
             except Exception as e:
+                error_details = {
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                }
+                request_context.add_metadata("error", error_details)
                 logger.error(
-                    "Unexpected error during request forwarding",
-                    request_id=str(request_context.request_id),
-                    destination_url=routing_result.destination_url,
-                    error=str(e)
+                    "Error processing webhook request",
+                    **error_details
                 )
-                return ProcessingResult(
-                    request_context=request_context,
-                    is_dropped=False,
-                    filtering_summary=filtering_summary,
-                    routing_summary=routing_summary,
-                    error_message=f"Forwarding error: {str(e)}",
-                    error_type="FORWARDING_ERROR",
-                    stage=ProcessingStage.FORWARDING
-                )
-            
-        except Exception as e:
-            error_details = {
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-            }
-            request_context.add_metadata("error", error_details)
-            logger.error(
-                "Error processing webhook request",
-                request_id=str(request_context.request_id),
-                **error_details
-            )
-            raise
+                raise
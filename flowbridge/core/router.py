@@ -14,7 +14,7 @@ from flowbridge.config.models import RouteMapping
 from flowbridge.utils.errors import RoutingError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoutingResult:
     """Result of routing decision process."""
     success: bool
@@ -26,6 +26,18 @@ class RoutingResult:
     extraction_result: Optional[FieldExtractionResult]
 
 
+# Shared result for the empty-rules branch; RoutingResult is immutable
+_NO_RULES_RESULT = RoutingResult(
+    success=False,
+    destination_url=None,
+    matched_value=None,
+    field_path="",
+    rule_index=None,
+    error_message="No routing rules configured",
+    extraction_result=None
+)
+
+
 class RoutingEngine:
     """
     Main routing engine that processes JSON payloads and determines destinations.
@@ -42,6 +54,21 @@ class RoutingEngine:
         """
         self.routing_rules = routing_rules
         self.field_extractor = FieldExtractor()
+        self._no_match_result = RoutingResult(
+            success=False,
+            destination_url=None,
+            matched_value=None,
+            field_path=routing_rules[0].field if routing_rules else "",
+            rule_index=None,
+            error_message="No matching routing rule found",
+            extraction_result=None
+        )
+        
+        # Resolve HttpUrl destinations to strings once, in rule order
+        self._destination_urls: List[Dict[str, str]] = [
+            {value: str(url) for value, url in rule.mappings.items()}
+            for rule in routing_rules
+        ]
         
     def find_destination(self, payload: Dict[str, Any]) -> RoutingResult:
         """
@@ -55,20 +82,14 @@ class RoutingEngine:
         """
         if not self.routing_rules:
             logger.info("No routing rules configured, dropping request")
-            return RoutingResult(
-                success=False,
-                destination_url=None,
-                matched_value=None,
-                field_path="",
-                rule_index=None,
-                error_message="No routing rules configured",
-                extraction_result=None
-            )
+            return _NO_RULES_RESULT
         
         # Process routing rules in order (first-match-wins)
         for rule_index, rule in enumerate(self.routing_rules):
             try:
-                result = self.evaluate_routing_rule(payload, rule, rule_index)
+                result = self.evaluate_routing_rule(
+                    payload, rule, rule_index, self._destination_urls[rule_index]
+                )
                 if result.success:
                     logger.info(
                         "Routing decision made",
@@ -90,17 +111,15 @@ class RoutingEngine:
         
         # No rules matched
         logger.info("No routing rules matched, dropping request")
-        return RoutingResult(
-            success=False,
-            destination_url=None,
-            matched_value=None,
-            field_path=self.routing_rules[0].field if self.routing_rules else "",
-            rule_index=None,
-            error_message="No matching routing rule found",
-            extraction_result=None
-        )
+        return self._no_match_result
     
-    def evaluate_routing_rule(self, payload: Dict[str, Any], rule: RouteMapping, rule_index: int) -> RoutingResult:
+    def evaluate_routing_rule(
+        self,
+        payload: Dict[str, Any],
+        rule: RouteMapping,
+        rule_index: int,
+        destination_urls: Optional[Dict[str, str]] = None
+    ) -> RoutingResult:
         """
         Evaluate a single routing rule against payload.
         
@@ -108,6 +127,8 @@ class RoutingEngine:
             payload: JSON payload to evaluate
             rule: Routing rule to evaluate
             rule_index: Index of rule in configuration
+            destination_urls: Rule mappings with destinations already converted
+                to strings; when omitted, the matched HttpUrl is converted
             
         Returns:
             RoutingResult with evaluation outcome
@@ -151,11 +172,13 @@ class RoutingEngine:
             )
         
         # Check if field value matches any mapping key (exact match)
-        destination_url_obj = rule.mappings.get(field_value)
+        if destination_urls is not None:
+            destination_url = destination_urls.get(field_value)
+        else:
+            destination_url_obj = rule.mappings.get(field_value)
+            destination_url = str(destination_url_obj) if destination_url_obj else None
         
-        if destination_url_obj:
-            # Convert HttpUrl to string for consistent handling throughout the system
-            destination_url = str(destination_url_obj)
+        if destination_url:
             logger.debug(
                 "Routing rule matched",
                 field_path=rule.field,
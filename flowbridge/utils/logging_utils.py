@@ -7,7 +7,8 @@ from loguru import logger
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[Union[str, Path]] = None,
-    rotation: str = "200 MB"
+    rotation: str = "200 MB",
+    buffering: int = 1
 ) -> None:
     """Configure logging for the FlowBridge application.
     
@@ -15,6 +16,9 @@ def setup_logging(
         log_level: The minimum log level to record
         log_file: Optional path to log file. If None, logs to stderr
         rotation: Log rotation size (e.g., "200 MB", "1 GB")
+        buffering: Log file buffer size in bytes. The default of 1 writes
+            each record as it is logged; larger values batch writes, which
+            are flushed when the buffer fills or the handler is removed
     """
     # Remove default logger
     logger.remove()
@@ -34,6 +38,7 @@ def setup_logging(
             format="{time} | {level} | {message} | {extra}",
             level=log_level,
             rotation=rotation,
+            buffering=buffering,
             serialize=True  # This enables JSON output
         )
     
@@ -20,6 +20,10 @@ bind = f"{server_config.get('host', '0.0.0.0')}:{server_config.get('port', 8000)
 # Worker configuration
 workers = server_config.get('workers', multiprocessing.cpu_count() * 2 + 1)
 worker_class = 'sync'
+# Load the app (config parsing, rule compilation) once in the master and
+# share it copy-on-write with workers; engines open no sockets or threads
+# until the first request, so forking after load is safe
+preload_app = True
 timeout = config.get('general', {}).get('route_timeout', 30)
 
 # Logging
@@ -1,11 +1,72 @@
+import os
 from pathlib import Path
+from unittest.mock import patch
+
 import pytest
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError as PydanticValidationError
 
+from flowbridge.config import loader
 from flowbridge.config.loader import load_config, validate_config_path, load_yaml_safely
 from flowbridge.utils.errors import ConfigurationError, ValidationError
 from flowbridge.config.models import ConfigModel
 
+_MISSING_FIELD_YAML: bytes = b"""
+    general:
+        route_timeout: 2
+    server:
+        host: "0.0.0.0"
+        port: 8000
+    """
+
+_PYTHON_TAG_YAML: bytes = b"""
+    general:
+        route_timeout: !!python/object/apply:os.getpid []
+    """
+
+_INVALID_VALUES_YAML: bytes = b"""
+    general:
+        route_timeout: -1  # Invalid: must be positive
+        log_rotation: "200mb"
+    server:
+        host: "0.0.0.0"
+        port: 8000
+        workers: 1
+        log_level: info
+    filtering:
+        default_action: drop
+        conditions:
+            logic: AND
+            rules: []  # Invalid: empty rules list
+    routes:
+        - field: "object.title"
+          mappings:
+            test-alert: "not_a_valid_url"  # Invalid URL format
+    """
+
+_INVALID_OPERATOR_YAML: bytes = b"""
+    general:
+        route_timeout: 2
+        log_rotation: "200mb"
+    server:
+        host: "0.0.0.0"
+        port: 8000
+        workers: 1
+        log_level: info
+    filtering:
+        default_action: drop
+        conditions:
+            logic: AND
+            rules:
+                - field: objectType
+                  operator: invalid_operator  # Invalid operator
+                  value: alert
+    routes:
+        - field: "object.title"
+          mappings:
+            test-alert: "http://localhost:5000/endpoint"
+    """
+
+
 def test_validate_config_path_valid(valid_config_file):
     """Test validation of a valid configuration file path."""
     path = validate_config_path(valid_config_file)
@@ -29,6 +90,14 @@ def test_load_yaml_safely_valid(valid_config_file):
     assert "filtering" in config_dict
     assert "routes" in config_dict
 
+def test_load_yaml_safely_rejects_python_tags(tmp_path):
+    """Test the safe loader refuses tags that would construct Python objects."""
+    config_file = tmp_path / "unsafe.yaml"
+    config_file.write_bytes(_PYTHON_TAG_YAML)
+    with pytest.raises(ConfigurationError) as exc_info:
+        load_yaml_safely(config_file)
+    assert "Failed to parse YAML configuration" in str(exc_info.value)
+
 def test_load_yaml_safely_invalid(invalid_yaml_file):
     """Test loading an invalid YAML configuration file."""
     with pytest.raises(ConfigurationError) as exc_info:
@@ -47,16 +116,43 @@ def test_load_config_valid(valid_config_file):
     assert isinstance(config.routes[0].mappings["test-alert1"], HttpUrl)
     assert isinstance(config.routes[0].mappings["test-alert2"], HttpUrl)
 
+def test_load_config_cached_while_file_unchanged(valid_config_file, tmp_path):
+    """Test repeated loads reuse the parsed config until the file changes."""
+    config_file = tmp_path / "cached.yaml"
+    config_file.write_bytes(valid_config_file.read_bytes())
+    
+    with patch.object(loader, "load_yaml_safely", wraps=loader.load_yaml_safely) as mock_load:
+        first = load_config(config_file)
+        second = load_config(config_file)
+        assert mock_load.call_count == 1
+        
+        assert first == second
+        with pytest.raises(PydanticValidationError):
+            first.general.route_timeout = 99
+        
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        load_config(config_file)
+        assert mock_load.call_count == 2
+
+def test_load_config_returns_independent_copies(valid_config_file, tmp_path):
+    """Test mutating a loaded config does not affect later loads."""
+    config_file = tmp_path / "isolated.yaml"
+    config_file.write_bytes(valid_config_file.read_bytes())
+    
+    first = load_config(config_file)
+    route_count = len(first.routes)
+    first.routes.clear()
+    first.filtering.conditions.rules.clear()
+    
+    second = load_config(config_file)
+    assert len(second.routes) == route_count
+    assert second.filtering.conditions.rules
+
 def test_load_config_missing_required_field(tmp_path):
     """Test loading a configuration with missing required fields."""
     config_file = tmp_path / "invalid_config.yaml"
-    config_file.write_text("""
-    general:
-        route_timeout: 2
-    server:
-        host: "0.0.0.0"
-        port: 8000
-    """)
+    config_file.write_bytes(_MISSING_FIELD_YAML)
     
     with pytest.raises(ValidationError) as exc_info:
         load_config(config_file)
@@ -66,60 +162,21 @@ def test_load_config_missing_required_field(tmp_path):
 def test_load_config_invalid_field_value(tmp_path):
     """Test loading a configuration with invalid field values."""
     config_file = tmp_path / "invalid_values.yaml"
-    config_file.write_text("""
-    general:
-        route_timeout: -1  # Invalid: must be positive
-        log_rotation: "200mb"
-    server:
-        host: "0.0.0.0"
-        port: 8000
-        workers: 1
-        log_level: info
-    filtering:
-        default_action: drop
-        conditions:
-            logic: AND
-            rules: []  # Invalid: empty rules list
-    routes:
-        - field: "object.title"
-          mappings:
-            test-alert: "not_a_valid_url"  # Invalid URL format
-    """)
+    config_file.write_bytes(_INVALID_VALUES_YAML)
     
     with pytest.raises(ValidationError) as exc_info:
         load_config(config_file)
     assert "Configuration validation failed" in str(exc_info.value)
     errors = exc_info.value.context["errors"]
-    assert any("route_timeout" in str(e) for e in errors)
+    assert any("route_timeout" in e.get("loc", ()) for e in errors)
 
 def test_load_config_invalid_filter_operator(tmp_path):
     """Test loading a configuration with invalid filter operator."""
     config_file = tmp_path / "invalid_operator.yaml"
-    config_file.write_text("""
-    general:
-        route_timeout: 2
-        log_rotation: "200mb"
-    server:
-        host: "0.0.0.0"
-        port: 8000
-        workers: 1
-        log_level: info
-    filtering:
-        default_action: drop
-        conditions:
-            logic: AND
-            rules:
-                - field: objectType
-                  operator: invalid_operator  # Invalid operator
-                  value: alert
-    routes:
-        - field: "object.title"
-          mappings:
-            test-alert: "http://localhost:5000/endpoint"
-    """)
+    config_file.write_bytes(_INVALID_OPERATOR_YAML)
     
     with pytest.raises(ValidationError) as exc_info:
         load_config(config_file)
     assert "Configuration validation failed" in str(exc_info.value)
     errors = exc_info.value.context["errors"]
-    assert any("operator" in str(e) for e in errors)
+    assert any("operator" in e.get("loc", ()) for e in errors)
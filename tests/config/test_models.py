@@ -237,41 +237,9 @@ class TestRouteMapping:
 
 class TestConfigModel:
     @pytest.fixture
-    def valid_config_dict(self) -> Dict[str, Any]:
-        """Create a valid configuration dictionary."""
-        return {
-            "general": {
-                "route_timeout": 2,
-                "log_rotation": "200mb"
-            },
-            "server": {
-                "host": "0.0.0.0",
-                "port": 8000,
-                "workers": 1,
-                "log_level": "info"
-            },
-            "filtering": {
-                "default_action": "drop",
-                "conditions": {
-                    "logic": "AND",
-                    "rules": [
-                        {
-                            "field": "objectType",
-                            "operator": "equals",
-                            "value": "alert"
-                        }
-                    ]
-                }
-            },
-            "routes": [
-                {
-                    "field": "object.title",
-                    "mappings": {
-                        "test-case": "http://localhost:8000/test"
-                    }
-                }
-            ]
-        }
+    def valid_config_dict(self, minimal_config_dict) -> Dict[str, Any]:
+        """Use the single-rule, single-route configuration for model tests."""
+        return minimal_config_dict
 
     def test_valid_complete_config(self, valid_config_dict):
         """Test valid complete configuration."""
@@ -303,3 +271,14 @@ class TestConfigModel:
         assert len(errors) == 1
         assert "server" in errors[0]["loc"]
         assert "port" in errors[0]["loc"]
+
+    def test_config_is_frozen(self, valid_config_dict):
+        """Test configuration models reject attribute assignment."""
+        config = ConfigModel(**valid_config_dict)
+        
+        with pytest.raises(ValidationError):
+            config.server.port = 9000
+        
+        updated = config.model_copy(update={"general": config.general.model_copy(update={"route_timeout": 5})})
+        assert updated.general.route_timeout == 5
+        assert config.general.route_timeout == 2
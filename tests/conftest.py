@@ -1,73 +1,122 @@
-import json
+import copy
 import os
 from pathlib import Path
 import pytest
-from typing import Dict, Any
+from typing import Any, Dict
 
 import yaml
+from orjson import loads as json_loads
 from flask import Flask
+from flask.testing import FlaskClient
 
 from flowbridge.app import create_app
 from flowbridge.config.loader import load_config
-from flowbridge.config.models import FilterCondition
+from flowbridge.config.models import FilterCondition, LogicOperator
 from flowbridge.core.processor import ProcessingPipeline
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
 
-@pytest.fixture
-def valid_config_dict():
-    """Return a valid configuration dictionary."""
-    return {
-        "general": {
-            "route_timeout": 2,
-            "log_rotation": "200mb"
-        },
-        "server": {
-            "host": "0.0.0.0",
-            "port": 8000,
-            "workers": 1,
-            "log_level": "info"
-        },
-        "filtering": {
-            "default_action": "drop",
-            "conditions": {
-                "logic": "AND",
-                "rules": [
-                    {
-                        "field": "objectType",
-                        "operator": "equals",
-                        "value": "alert"
-                    },
-                    {
-                        "field": "operation",
-                        "operator": "equals",
-                        "value": "Creation"
-                    }
-                ]
-            }
-        },
-        "routes": [
-            {
-                "field": "object.title",
-                "mappings": {
-                    "test-alert1": "http://localhost:5001/endpoint",
-                    "test-alert2": "http://localhost:5002/endpoint"
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-stress",
+        action="store_true",
+        default=False,
+        help="Run tests marked as stress tests"
+    )
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "stress: concurrent load test, skipped unless --run-stress is given")
+
+def pytest_collection_modifyitems(config: pytest.Config, items) -> None:
+    if config.getoption("--run-stress"):
+        return
+    skip_stress = pytest.mark.skip(reason="stress test; use --run-stress to run")
+    for item in items:
+        if "stress" in item.keywords:
+            item.add_marker(skip_stress)
+
+_VALID_CONFIG: Dict[str, Any] = {
+    "general": {
+        "route_timeout": 2,
+        "log_rotation": "200mb"
+    },
+    "server": {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "workers": 1,
+        "log_level": "info"
+    },
+    "filtering": {
+        "default_action": "drop",
+        "conditions": {
+            "logic": "AND",
+            "rules": [
+                {
+                    "field": "objectType",
+                    "operator": "equals",
+                    "value": "alert"
+                },
+                {
+                    "field": "operation",
+                    "operator": "equals",
+                    "value": "Creation"
                 }
+            ]
+        }
+    },
+    "routes": [
+        {
+            "field": "object.title",
+            "mappings": {
+                "test-alert1": "http://localhost:5001/endpoint",
+                "test-alert2": "http://localhost:5002/endpoint"
             }
-        ]
-    }
+        }
+    ]
+}
+
+# Single filtering rule and a single route, derived from the full configuration
+_MINIMAL_CONFIG: Dict[str, Any] = copy.deepcopy(_VALID_CONFIG)
+del _MINIMAL_CONFIG["filtering"]["conditions"]["rules"][1:]
+_MINIMAL_CONFIG["routes"][0]["mappings"] = {"test-case": "http://localhost:8000/test"}
+
 
 @pytest.fixture
-def valid_config_file(tmp_path: Path, valid_config_dict):
-    """Create a temporary valid configuration file."""
-    config_file = tmp_path / "config.yaml"
+def valid_config_dict() -> Dict[str, Any]:
+    """Return a valid configuration dictionary that tests may mutate."""
+    return copy.deepcopy(_VALID_CONFIG)
+
+@pytest.fixture
+def minimal_config_dict() -> Dict[str, Any]:
+    """Return a valid single-rule, single-route configuration dictionary that tests may mutate."""
+    return copy.deepcopy(_MINIMAL_CONFIG)
+
+def _write_config_file(tmp_path_factory: pytest.TempPathFactory, config: Dict[str, Any], name: str) -> Path:
+    config_file = tmp_path_factory.mktemp("cfg") / name
     with config_file.open('w') as f:
-        yaml.safe_dump(valid_config_dict, f)
+        yaml.dump(config, f, Dumper=SafeDumper)
     return config_file
 
-@pytest.fixture
-def invalid_yaml_file(tmp_path: Path):
+@pytest.fixture(scope="session")
+def valid_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary valid configuration file."""
+    return _write_config_file(tmp_path_factory, _VALID_CONFIG, "config.yaml")
+
+@pytest.fixture(scope="session")
+def minimal_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary single-rule, single-route configuration file."""
+    return _write_config_file(tmp_path_factory, _MINIMAL_CONFIG, "minimal_config.yaml")
+
+@pytest.fixture(scope="session")
+def invalid_yaml_file(tmp_path_factory: pytest.TempPathFactory):
     """Create a temporary file with invalid YAML syntax."""
-    config_file = tmp_path / "invalid.yaml"
+    config_file = tmp_path_factory.mktemp("cfg") / "invalid.yaml"
     config_file.write_text("""
     general:
         route_timeout: 2
@@ -95,88 +144,125 @@ def invalid_yaml_file(tmp_path: Path):
     """)
     return config_file
 
-@pytest.fixture
-def test_config():
-    """Load test configuration for filtering implementation using the config loader."""
-    config_path = Path(__file__).parent / "fixtures" / "filtering_impl_config.yaml"
+@pytest.fixture(scope="session")
+def _test_config_cached():
+    """Load test configuration for filtering implementation once per session."""
+    config_path = _FIXTURES_DIR / "filtering_impl_config.yaml"
     return load_config(str(config_path))
 
 @pytest.fixture
+def test_config(_test_config_cached):
+    """Shared test configuration; fixtures that mutate it must model_copy first."""
+    return _test_config_cached
+
+@pytest.fixture(scope="session")
 def webhook_payloads() -> Dict[str, Any]:
-    """Load test webhook payloads."""
-    payload_path = Path(__file__).parent / "fixtures" / "webhook_payloads.json"
-    with open(payload_path) as f:
-        return json.load(f)
+    """Load test webhook payloads once per session (shared; do not mutate)."""
+    payload_path = _FIXTURES_DIR / "webhook_payloads.json"
+    return json_loads(payload_path.read_bytes())
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_payloads() -> Dict[str, Any]:
-    """Load error test payloads."""
-    error_path = Path(__file__).parent / "fixtures" / "error_payloads.json"
-    with open(error_path) as f:
-        return json.load(f)
+    """Load error test payloads once per session (shared; do not mutate)."""
+    error_path = _FIXTURES_DIR / "error_payloads.json"
+    return json_loads(error_path.read_bytes())
 
-@pytest.fixture
-def app(test_config) -> Flask:
-    """Create Flask test application with test configuration."""
-    return create_app(test_config)
+@pytest.fixture(scope="session")
+def app(_test_config_cached) -> Flask:
+    """Create Flask test application with test configuration (once per session)."""
+    return create_app(_test_config_cached)
 
 @pytest.fixture
-def processing_pipeline(test_config) -> ProcessingPipeline:
-    """Create ProcessingPipeline instance with test configuration."""
-    return ProcessingPipeline(config=test_config)
+def client(app) -> FlaskClient:
+    """Create test client for the session test application."""
+    return app.test_client()
+
+@pytest.fixture(scope="session")
+def unconfigured_app() -> Flask:
+    """Create Flask app without configuration, for tests that patch the pipeline (once per session)."""
+    return create_app()
+
+@pytest.fixture(scope="session")
+def processing_pipeline(_test_config_cached) -> ProcessingPipeline:
+    """Create ProcessingPipeline instance with test configuration (once per session)."""
+    pipeline = ProcessingPipeline(config=_test_config_cached)
+    yield pipeline
+    pipeline.request_forwarder.close()
 
 @pytest.fixture
 def test_filtering_config(test_config):
     """Get the filtering configuration for testing."""
     return test_config.filtering
 
-@pytest.fixture
-def empty_rules_config(test_config):
+@pytest.fixture(scope="session")
+def empty_rules_config(_test_config_cached):
     """Create a test configuration with empty rules."""
-    config = test_config.model_copy(deep=True)
-    config.filtering.conditions.rules = []
-    config.filtering.default_action = "pass"
-    return config
+    filtering = _test_config_cached.filtering
+    return _test_config_cached.model_copy(update={
+        "filtering": filtering.model_copy(update={
+            "default_action": "pass",
+            "conditions": filtering.conditions.model_copy(update={"rules": []})
+        })
+    })
 
-@pytest.fixture
-def complex_rules_config(test_config):
+@pytest.fixture(scope="session")
+def complex_rules_config(_test_config_cached):
     """Create a test configuration with complex rules."""
-    config = test_config.model_copy(deep=True)
-    config.filtering.conditions.logic = "OR"
-    config.filtering.conditions.rules = [
-        FilterCondition(
-            field="object.severity",
-            operator="greater_than",
-            value=7
-        ),
-        FilterCondition(
-            field="object.title",
-            operator="contains_any",
-            value=["virus", "malware", "trojan"]
-        )
-    ]
-    return config
+    filtering = _test_config_cached.filtering
+    return _test_config_cached.model_copy(update={
+        "filtering": filtering.model_copy(update={
+            "conditions": filtering.conditions.model_copy(update={
+                "logic": LogicOperator.OR,
+                "rules": [
+                    FilterCondition(
+                        field="object.severity",
+                        operator="greater_than",
+                        value=7
+                    ),
+                    FilterCondition(
+                        field="object.title",
+                        operator="contains_any",
+                        value=["virus", "malware", "trojan"]
+                    )
+                ]
+            })
+        })
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processing_pipeline_empty_rules(empty_rules_config) -> ProcessingPipeline:
-    """Create ProcessingPipeline instance with empty rules configuration."""
-    return ProcessingPipeline(config=empty_rules_config)
+    """Create ProcessingPipeline instance with empty rules configuration (once per session)."""
+    pipeline = ProcessingPipeline(config=empty_rules_config)
+    yield pipeline
+    pipeline.request_forwarder.close()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processing_pipeline_complex_rules(complex_rules_config) -> ProcessingPipeline:
-    """Create ProcessingPipeline instance with complex rules configuration."""
-    return ProcessingPipeline(config=complex_rules_config)
+    """Create ProcessingPipeline instance with complex rules configuration (once per session)."""
+    pipeline = ProcessingPipeline(config=complex_rules_config)
+    yield pipeline
+    pipeline.request_forwarder.close()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_with_empty_rules(empty_rules_config):
-    """Create Flask app with empty filtering rules configuration."""
+    """Create Flask app with empty filtering rules configuration (once per session)."""
     app = create_app(empty_rules_config)
     app.config['TESTING'] = True
     return app
 
-@pytest.fixture
-def app_with_filtering_config(test_config) -> Flask:
-    """Create Flask app with filtering configuration for integration tests."""
-    app = create_app(test_config)
+@pytest.fixture(scope="session")
+def app_with_filtering_config(_test_config_cached) -> Flask:
+    """Create Flask app with filtering configuration for integration tests (once per session)."""
+    app = create_app(_test_config_cached)
     app.config['TESTING'] = True
     return app
+
+@pytest.fixture(scope="session")
+def filtering_client(app_with_filtering_config) -> FlaskClient:
+    """Shared test client for the filtering configuration app (once per session)."""
+    return app_with_filtering_config.test_client()
+
+@pytest.fixture(scope="session")
+def empty_rules_client(app_with_empty_rules) -> FlaskClient:
+    """Shared test client for the empty rules configuration app (once per session)."""
+    return app_with_empty_rules.test_client()
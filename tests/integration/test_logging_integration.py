@@ -1,10 +1,18 @@
-import json
+import sys
 from pathlib import Path
 import pytest
 from loguru import logger
+from orjson import loads as json_loads
 
 from flowbridge.utils.logging_utils import setup_logging, log_config_loaded, log_config_error
 
+@pytest.fixture(autouse=True)
+def _restore_default_logging():
+    """Drop sinks added by setup_logging so tmp files and captured streams don't leak into other tests."""
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
 class TestLoggingIntegration:
     def test_file_logging_setup(self, tmp_path: Path):
         """Test logging setup with file output."""
@@ -18,22 +26,16 @@ class TestLoggingIntegration:
         test_message = "Test log message"
         logger.debug(test_message)
         
-        # Verify log file exists and contains the message
+        # Verify log file exists
         assert log_file.exists()
-        log_content = log_file.read_text()
-        assert test_message in log_content
-        
-        # Verify JSON structure - parse each line separately
-        log_lines = log_content.strip().split('\n')
-        test_log_entry = None
         
-        # Find the log entry with our test message
-        for line in log_lines:
-            if line.strip():  # Skip empty lines
-                entry = json.loads(line)
-                if test_message in entry.get("text", ""):
-                    test_log_entry = entry
-                    break
+        # Verify JSON structure - parse lines as bytes, stopping at our test message
+        with log_file.open('rb') as f:
+            entries = map(json_loads, filter(bytes.strip, f))
+            test_log_entry = next(
+                (entry for entry in entries if test_message in entry.get("text", "")),
+                None
+            )
         
         assert test_log_entry is not None, "Test message not found in log entries"
         
@@ -45,6 +47,17 @@ class TestLoggingIntegration:
         assert "message" in test_log_entry["record"]
         assert test_log_entry["record"]["message"] == test_message
 
+    def test_buffered_file_logging(self, tmp_path: Path):
+        """Test buffered file logging defers writes until the handler is removed."""
+        log_file = tmp_path / "buffered.log"
+        setup_logging(log_level="DEBUG", log_file=log_file, buffering=64 * 1024)
+        
+        logger.debug("Buffered message")
+        assert b"Buffered message" not in log_file.read_bytes()
+        
+        logger.remove()
+        assert b"Buffered message" in log_file.read_bytes()
+
     def test_config_loaded_logging(self, tmp_path: Path, capsys):
         """Test configuration loaded logging with sections."""
         setup_logging()
@@ -1,22 +1,8 @@
-import json
-import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 from werkzeug.test import TestResponse
 
-from flowbridge import create_app, load_config
-
-@pytest.fixture
-def app() -> Flask:
-    """Create Flask application for testing."""
-    config = load_config("config.yaml")
-    app = create_app(config)
-    return app
-
-@pytest.fixture
-def client(app: Flask) -> FlaskClient:
-    """Create test client."""
-    return app.test_client()
+from flowbridge.api.json_provider import OrjsonProvider
 
 def test_app_startup_with_config(app: Flask):
     """Validate Flask app starts with valid config."""
@@ -24,6 +10,11 @@ def test_app_startup_with_config(app: Flask):
     assert app.config.get('SERVER_CONFIG') is not None
     assert app.config.get('GENERAL_CONFIG') is not None
 
+def test_app_uses_orjson_provider(app: Flask):
+    """Validate the orjson JSON provider is installed and round-trips payloads."""
+    assert isinstance(app.json, OrjsonProvider)
+    assert app.json.loads(app.json.dumps({'b': 1, 'a': [1, 2]})) == {'a': [1, 2], 'b': 1}
+
 def test_health_endpoint_response(client: FlaskClient):
     """Validate health endpoint returns correct response."""
     response: TestResponse = client.get('/health')
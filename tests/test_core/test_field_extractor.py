@@ -1,3 +1,7 @@
+import sys
+from collections import defaultdict
+from dataclasses import FrozenInstanceError
+
 import pytest
 from flowbridge.core.field_extractor import FieldExtractor, FieldExtractionResult
 
@@ -195,6 +199,16 @@ class TestFieldExtractor:
         assert not result.success
         assert "Key 'missing_level' not found" in result.error_message
 
+    def test_missing_key_does_not_mutate_payload(self, extractor):
+        """Test a missing key in a defaultdict is reported without being inserted."""
+        nested = defaultdict(dict, {"present": "value"})
+        payload = {"level1": nested}
+        
+        result = extractor.extract_field(payload, "level1.absent")
+        assert not result.success
+        assert "Key 'absent' not found" in result.error_message
+        assert "absent" not in nested
+
     def test_none_intermediate_values(self, extractor):
         """Test extraction when intermediate values are None."""
         payload = {
@@ -259,6 +273,18 @@ class TestFieldExtractor:
         with pytest.raises(ValueError, match="Field path must be a non-empty string"):
             extractor.parse_field_path([])
 
+    def test_parsed_field_path_is_cached(self, extractor):
+        """Test that repeated parses of a path return the same cached components."""
+        first = extractor.parse_field_path("severity.level")
+        assert first == ("severity", "level")
+        assert extractor.parse_field_path("severity.level") is first
+        assert first[1] is sys.intern("level")
+        
+        # Invalid paths are not cached and keep failing
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Field path contains empty components"):
+                extractor.parse_field_path("severity..level")
+
     def test_extraction_result_properties(self, extractor, sample_payload):
         """Test that FieldExtractionResult contains all expected properties."""
         result = extractor.extract_field(sample_payload, "objectType")
@@ -269,4 +295,48 @@ class TestFieldExtractor:
         assert hasattr(result, 'error_message')
         
         assert result.field_path == "objectType"
-        assert isinstance(result.success, bool)
\ No newline at end of file
+        assert isinstance(result.success, bool)
+
+    def test_extraction_result_is_immutable(self, extractor, sample_payload):
+        """Test FieldExtractionResult is frozen and has no instance dict."""
+        result = extractor.extract_field(sample_payload, "objectType")
+        
+        with pytest.raises(FrozenInstanceError):
+            result.value = "changed"
+        assert not hasattr(result, "__dict__")
+
+    def test_none_and_failure_results_are_shared(self, extractor, sample_payload):
+        """Test that None-valued and failed extractions reuse cached results."""
+        none_result = extractor.extract_field(sample_payload, "metadata.source.id")
+        assert none_result.success and none_result.value is None
+        assert extractor.extract_field(sample_payload, "metadata.source.id") is none_result
+        
+        failure = extractor.extract_field(sample_payload, "severity.missing")
+        assert not failure.success
+        assert extractor.extract_field(sample_payload, "severity.missing") is failure
+        
+        # Non-string paths still produce a failed result
+        result = extractor.extract_field(sample_payload, [])
+        assert not result.success
+        assert "Field path must be a non-empty string" in result.error_message
+
+    def test_extract_fields_matches_extract_field(self, extractor, sample_payload):
+        """Test batch extraction returns the same results as per-path extraction."""
+        paths = [
+            "objectType",
+            "severity.level",
+            "metadata.source.id",
+            "severity.missing",
+            "tags.first",
+            "severity..level"
+        ]
+        
+        results = extractor.extract_fields(sample_payload, paths)
+        assert list(results) == paths
+        for path in paths:
+            assert results[path] == extractor.extract_field(sample_payload, path)
+        
+        # A non-dict payload fails every path
+        results = extractor.extract_fields(["not", "a", "dict"], ["objectType", "severity.level"])
+        assert all(not result.success for result in results.values())
+        assert results["objectType"].error_message == "Payload must be a dictionary"
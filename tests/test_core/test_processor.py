@@ -3,6 +3,8 @@ from typing import Dict, Any
 import pytest
 from unittest.mock import Mock, patch
 
+from loguru import logger
+
 from flowbridge.core.processor import ProcessingPipeline
 from flowbridge.core.context import RequestContext
 from flowbridge.core.models import (
@@ -241,6 +243,28 @@ class TestFilteringStageIntegration:
             assert result.filtering_summary.rules_evaluated == 2
             assert result.filtering_summary.default_action_applied is True
 
+    def test_logs_bound_to_request_id(
+        self,
+        processing_pipeline: ProcessingPipeline,
+        webhook_payloads: Dict[str, Any],
+        request_context: RequestContext
+    ):
+        """Test every log record emitted during processing carries the request ID."""
+        records = []
+        sink_id = logger.add(lambda message: records.append(message.record), level="DEBUG")
+        try:
+            processing_pipeline.process_webhook_request(
+                webhook_payloads["wrong_type"], request_context
+            )
+        finally:
+            logger.remove(sink_id)
+        
+        assert records
+        assert all(
+            record["extra"]["request_id"] == request_context.request_id_str
+            for record in records
+        )
+
     def test_process_valid_complex_request_pass(
         self,
         processing_pipeline: ProcessingPipeline,
@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 from unittest.mock import Mock, patch
 from pydantic import HttpUrl
@@ -466,6 +468,32 @@ class TestRoutingEngine:
         assert result.error_message is None
         assert result.extraction_result is None
 
+    def test_routing_result_is_immutable(self, empty_routing_engine):
+        """Test RoutingResult is frozen and the empty-rules result is shared."""
+        result = empty_routing_engine.find_destination({})
+        
+        with pytest.raises(FrozenInstanceError):
+            result.success = True
+        assert not hasattr(result, "__dict__")
+        assert empty_routing_engine.find_destination({"other": 1}) is result
+
+    @patch('flowbridge.core.router.logger')
+    @patch('flowbridge.core.field_extractor.logger')
+    def test_rules_after_match_are_not_evaluated(self, mock_extractor_logger, mock_logger):
+        """Test fields of rules after the matching one are never extracted."""
+        route_mappings = [
+            RouteMapping(field="event.type", mappings={"a": HttpUrl("http://a.com/api")}),
+            RouteMapping(field="event.action", mappings={"b": HttpUrl("http://b.com/api")})
+        ]
+        engine = RoutingEngine(route_mappings)
+        
+        result = engine.find_destination({"event": {"type": "a"}})
+        
+        assert result.success
+        assert result.rule_index == 0
+        mock_extractor_logger.warning.assert_not_called()
+        mock_logger.warning.assert_not_called()
+
     def test_http_url_to_string_conversion(self):
         """Test that HttpUrl objects are properly converted to strings."""
         route_mappings = [
@@ -489,6 +517,10 @@ class TestRoutingEngine:
         assert result.success
         assert isinstance(result.destination_url, str)
         assert result.destination_url == "https://example.com/webhook"
+        
+        # Evaluating a rule directly converts the matched URL the same way
+        direct = engine.evaluate_routing_rule(payload, route_mappings[0], 0)
+        assert direct.destination_url == "https://example.com/webhook"
 
     def test_exception_handling_in_rule_evaluation(self, routing_engine):
         """Test exception handling during rule evaluation."""